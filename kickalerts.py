@@ -1,8 +1,12 @@
 import aiohttp
 import asyncio
 import logging
+import re
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Set, Tuple
 
 import discord
 from redbot.core import commands, Config, checks
@@ -10,11 +14,77 @@ from redbot.core.bot import Red
 from redbot.core.utils.chat_formatting import pagify, box
 from redbot.core.utils.menus import menu, DEFAULT_CONTROLS
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+# aiohttp can only decode brotli responses when one of these is installed
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = "gzip, deflate, br"
+    except ImportError:
+        ACCEPT_ENCODING = "gzip, deflate"
+
 log = logging.getLogger("red.kickalerts")
 
+# Kick API and HTTP
 KICK_API_BASE = "https://kick.com/api/v2/channels"
 KICK_BASE_URL = "https://kick.com"
+KICK_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "application/json",
+    "Accept-Encoding": ACCEPT_ENCODING,
+}
+
+# Request throttling and the channel lookup cache
+KICK_MAX_CONCURRENT = 5  # Kick requests in flight at once
+KICK_RATE_LIMIT = 10  # sustained Kick requests per second (token bucket refill)
+CHANNEL_CACHE_TTL = 20  # seconds a successful channel lookup is reused
+CHANNEL_CACHE_MAX = 512  # least recently used lookups are evicted beyond this
+
+# Streamers offline for this many polls in a row are checked less often,
+# doubling the delay from the base up to the cap
+OFFLINE_BACKOFF_AFTER = 3
+OFFLINE_BACKOFF_BASE = 60
+OFFLINE_BACKOFF_MAX = 600
+
+# Per-streamer keys written by the checker (everything else is user-set)
+STREAMER_STATE_KEYS = (
+    "is_live",
+    "last_stream_id",
+    "last_message_id",
+    "last_viewer_count",
+    "last_title",
+    "last_category",
+)
+# Relative viewer-count change needed before a live embed is re-edited
+VIEWER_DELTA_THRESHOLD = 0.1
+
+# Announcements and display text
 KICK_COLOR = 0x53FC18  # Kick's signature green
+KICK_FAVICON = f"{KICK_BASE_URL}/favicon.ico"
+LIVE_FOOTER_TEXT = "Kick.com • Live Stream Alert"
+# Custom message placeholders; anything else in braces is sent as written
+PLACEHOLDER_RE = re.compile(r"\{(streamer|game|title|url|viewers)\}")
+# Shown by `kickalert settings`
+STYLE_DISPLAY = {"detailed": "Detailed", "minimal": "Minimal"}
+YES_NO = {False: "No", True: "Yes"}
+# Mock values `kickalert test` fills in when the streamer is offline
+TEST_DEFAULTS = MappingProxyType({
+    "is_live": True,
+    "stream_title": "🔴 Test Stream — This is a Preview!",
+    "viewer_count": 1234,
+    "category": "Just Chatting",
+    "tags": ("English", "Test"),
+})
 
 
 class KickAlerts(commands.Cog):
@@ -23,9 +93,48 @@ class KickAlerts(commands.Cog):
     __version__ = "1.3.0"
     __author__ = "YourName"
 
+    # (name, value from guild config, inline) for each field of `kickalert settings`
+    _SETTINGS_FIELDS = (
+        (
+            "📺 Global Channel",
+            lambda d: "<#%d>" % d["global_channel_id"] if d.get("global_channel_id") else "Not set",
+            True,
+        ),
+        (
+            "🔔 Global Ping Role",
+            lambda d: "<@&%d>" % d["global_ping_role_id"] if d.get("global_ping_role_id") else "None",
+            True,
+        ),
+        ("📊 Monitored Streamers", lambda d: str(len(d.get("streamers", {}))), True),
+        ("⏱️ Check Interval", lambda d: f"{d.get('check_interval', 60)}s", True),
+        (
+            "🎨 Embed Style",
+            lambda d: STYLE_DISPLAY.get(d.get("embed_style", "detailed"), d.get("embed_style")),
+            True,
+        ),
+        ("🗑️ Auto-Delete on Offline", lambda d: YES_NO[bool(d.get("auto_delete", False))], True),
+        ("👁️ Show Viewers", lambda d: YES_NO[bool(d.get("show_viewer_count", True))], True),
+        ("🎮 Show Category", lambda d: YES_NO[bool(d.get("show_category", True))], True),
+    )
+
     def __init__(self, bot: Red):
         self.bot = bot
         self.session: Optional[aiohttp.ClientSession] = None
+        self._timeout = aiohttp.ClientTimeout(total=15, connect=5, sock_read=10)
+        # username -> (time.monotonic() of fetch, API response)
+        self._channel_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # username -> request already in flight, shared by concurrent callers
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Cog-wide throttle for Kick requests; see _await_token
+        self._kick_sem = asyncio.Semaphore(KICK_MAX_CONCURRENT)
+        self._tokens: float = KICK_RATE_LIMIT
+        self._last_refill = time.monotonic()
+        # Streamer state changed by the checker, waiting for _flush_state
+        self._state_cache: Dict[int, Dict[str, Dict[str, Any]]] = {}
+        self._dirty: Set[Tuple[int, str]] = set()
+        # Adaptive polling state per username (in memory only)
+        self._offline_streaks: Dict[str, int] = {}
+        self._next_check: Dict[str, float] = {}
         self.config = Config.get_conf(self, identifier=7274927492, force_registration=True)
 
         default_guild = {
@@ -39,6 +148,9 @@ class KickAlerts(commands.Cog):
             #     "last_message_id": int | None,
             #     "is_live": bool,
             #     "last_stream_id": int | None,
+            #     "last_viewer_count": int,   # As shown in the live embed
+            #     "last_title": str | None,
+            #     "last_category": str | None,
             # }
             "global_channel_id": None,
             "global_ping_role_id": None,
@@ -51,29 +163,33 @@ class KickAlerts(commands.Cog):
 
         self.config.register_guild(**default_guild)
         self._check_task: Optional[asyncio.Task] = None
+        # Shortest check_interval among guilds with streamers; see _refresh_min_interval
+        self._min_interval: int = 60
         self._ready = asyncio.Event()
+        self._unloading = False
+        # Sent announcements keyed by (guild_id, username), saves a fetch_message per edit
+        self._live_messages: Dict[Tuple[int, str], discord.Message] = {}
 
     async def cog_load(self):
         """Called when the cog is loaded."""
-        self.session = aiohttp.ClientSession(
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                              "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "application/json",
-            }
-        )
+        self.session = self._create_session()
+        await self._refresh_min_interval()
         self._check_task = asyncio.create_task(self._stream_checker_loop())
         self._ready.set()
         log.info("KickAlerts cog loaded and stream checker started.")
 
     async def cog_unload(self):
         """Cleanup on cog unload."""
+        self._unloading = True
         if self._check_task:
             self._check_task.cancel()
             try:
                 await self._check_task
             except asyncio.CancelledError:
                 pass
+        for request in list(self._inflight.values()):
+            request.cancel()
+        await self._flush_state()
         if self.session and not self.session.closed:
             await self.session.close()
         log.info("KickAlerts cog unloaded.")
@@ -85,67 +201,156 @@ class KickAlerts(commands.Cog):
 
     # ─── API Interaction ────────────────────────────────────────────────
 
-    async def _fetch_channel_data(self, username: str) -> Optional[Dict[str, Any]]:
-        """Fetch channel data from Kick's API."""
+    def _create_session(self) -> aiohttp.ClientSession:
+        """Create an HTTP session with a pooled, keep-alive connector for Kick."""
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=10,
+            keepalive_timeout=75,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            headers=KICK_HEADERS,
+            timeout=self._timeout,
+            raise_for_status=False,
+        )
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, recreating it if it was closed."""
         if not self.session or self.session.closed:
-            self.session = aiohttp.ClientSession(
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                                  "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                    "Accept": "application/json",
-                }
+            if self._unloading:
+                # A new session here would outlive the cog and never be closed
+                raise aiohttp.ClientConnectionError("KickAlerts is unloading")
+            self.session = self._create_session()
+        return self.session
+
+    async def _fetch_channel_data(
+        self, username: str, force: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch channel data from Kick's API.
+
+        Successful responses are reused for ``CHANNEL_CACHE_TTL`` seconds
+        unless ``force`` is set, and concurrent lookups of the same channel
+        share a single request.
+        """
+        username = username.lower()
+        if not force:
+            data = self._channel_cache_get(username)
+            if data is not None:
+                return data
+
+        request = self._inflight.get(username)
+        if request is None:
+            request = asyncio.create_task(self._request_channel_data(username))
+            self._inflight[username] = request
+            request.add_done_callback(
+                lambda task, username=username: self._finish_request(username, task)
             )
-
-        url = f"{KICK_API_BASE}/{username.lower()}"
-        try:
-            async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    return data
-                elif resp.status == 404:
-                    log.debug(f"Kick channel not found: {username}")
-                    return None
-                else:
-                    log.warning(f"Kick API returned {resp.status} for {username}")
-                    return None
-        except asyncio.TimeoutError:
-            log.warning(f"Timeout fetching Kick data for {username}")
-            return None
-        except aiohttp.ClientError as e:
-            log.warning(f"HTTP error fetching Kick data for {username}: {e}")
-            return None
-        except Exception as e:
-            log.error(f"Unexpected error fetching Kick data for {username}: {e}", exc_info=True)
-            return None
+        # Shielded so one caller being cancelled doesn't cancel the others' request
+        return await asyncio.shield(request)
+
+    def _channel_cache_get(self, username: str) -> Optional[Dict[str, Any]]:
+        """Return a cached channel response that is still fresh, or ``None``."""
+        entry = self._channel_cache.get(username.lower())
+        if entry and time.monotonic() - entry[0] < CHANNEL_CACHE_TTL:
+            self._channel_cache.move_to_end(username.lower())
+            return entry[1]
+        return None
+
+    def _finish_request(self, username: str, task: asyncio.Task):
+        """Retire a finished in-flight request and cache its result."""
+        if self._inflight.get(username) is task:
+            del self._inflight[username]
+        if task.cancelled() or task.exception() is not None:
+            return
+        data = task.result()
+        if data is not None:
+            self._channel_cache[username] = (time.monotonic(), data)
+            self._channel_cache.move_to_end(username)
+            while len(self._channel_cache) > CHANNEL_CACHE_MAX:
+                self._channel_cache.popitem(last=False)
+
+    async def _await_token(self):
+        """Wait for the shared token bucket to allow another Kick request."""
+        while True:
+            now = time.monotonic()
+            elapsed = now - self._last_refill
+            self._tokens = min(KICK_RATE_LIMIT, self._tokens + elapsed * KICK_RATE_LIMIT)
+            self._last_refill = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / KICK_RATE_LIMIT)
+
+    async def _request_channel_data(self, username: str) -> Optional[Dict[str, Any]]:
+        """Perform the HTTP request for a channel, returning ``None`` on any failure."""
+        # Every Kick request, from the loop or any command, shares these limits
+        async with self._kick_sem:
+            await self._await_token()
+            url = f"{KICK_API_BASE}/{username}"
+            try:
+                # Raises ClientConnectionError while unloading, logged below
+                session = await self._get_session()
+                async with session.get(url) as resp:
+                    if resp.status == 200:
+                        data = await resp.json(loads=_json_loads)
+                        return data
+                    elif resp.status == 404:
+                        log.debug(f"Kick channel not found: {username}")
+                        return None
+                    else:
+                        log.warning(f"Kick API returned {resp.status} for {username}")
+                        return None
+            except asyncio.TimeoutError:
+                log.warning(f"Timeout fetching Kick data for {username}")
+                return None
+            except aiohttp.ClientError as e:
+                log.warning(f"HTTP error fetching Kick data for {username}: {e}")
+                return None
+            except Exception as e:
+                log.error(f"Unexpected error fetching Kick data for {username}: {e}", exc_info=True)
+                return None
 
     def _parse_stream_info(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Parse the API response into a clean stream info dict."""
         livestream = data.get("livestream")
         is_live = livestream is not None and livestream.get("is_live", False)
+        user = data.get("user") or {}
+        slug = data.get("slug")
+        banner = data.get("banner_image")
+        followers = data.get("followersCount") or 0
 
         info = {
             "is_live": is_live,
-            "username": data.get("slug", data.get("user", {}).get("username", "Unknown")),
-            "display_name": data.get("user", {}).get("username", data.get("slug", "Unknown")),
-            "avatar_url": data.get("user", {}).get("profile_pic", None),
-            "channel_url": f"{KICK_BASE_URL}/{data.get('slug', '')}",
-            "followers": data.get("followersCount", 0),
+            "username": slug or user.get("username") or "Unknown",
+            "display_name": user.get("username") or slug or "Unknown",
+            "avatar_url": user.get("profile_pic"),
+            "channel_url": f"{KICK_BASE_URL}/{slug or ''}",
+            "followers": followers,
+            "followers_fmt": f"{followers:,}",
             "is_verified": data.get("verified", False),
-            "banner_url": data.get("banner_image", {}).get("url") if data.get("banner_image") else None,
+            "banner_url": banner.get("url") if banner else None,
         }
 
         if is_live and livestream:
+            categories = livestream.get("categories")
+            if categories:
+                category = categories[0].get("name", "Unknown")
+            else:
+                category = (livestream.get("category") or {}).get("name", "Unknown")
+
+            thumbnail = livestream.get("thumbnail")
+            if isinstance(thumbnail, dict):
+                thumbnail = thumbnail.get("url")
+
             info.update({
                 "stream_id": livestream.get("id"),
                 "stream_title": livestream.get("session_title", "No Title"),
                 "viewer_count": livestream.get("viewer_count", 0),
-                "category": livestream.get("categories", [{}])[0].get("name", "Unknown")
-                            if livestream.get("categories") else
-                            (livestream.get("category", {}).get("name", "Unknown")
-                             if livestream.get("category") else "Unknown"),
-                "thumbnail_url": livestream.get("thumbnail", {}).get("url")
-                                 if isinstance(livestream.get("thumbnail"), dict)
-                                 else livestream.get("thumbnail"),
+                "category": category,
+                "thumbnail_url": thumbnail,
                 "started_at": livestream.get("created_at", None),
                 "language": livestream.get("language", "en"),
                 "is_mature": livestream.get("is_mature", False),
@@ -174,12 +379,16 @@ class KickAlerts(commands.Cog):
         style: str = "detailed",
         show_viewers: bool = True,
         show_category: bool = True,
+        now: Optional[datetime] = None,
     ) -> discord.Embed:
-        """Build a beautiful embed for a live stream announcement."""
+        """Build a beautiful embed for a live stream announcement.
+
+        ``now`` lets the checker stamp every embed of a cycle with one timestamp.
+        """
 
         embed = discord.Embed(
             color=KICK_COLOR,
-            timestamp=datetime.now(timezone.utc),
+            timestamp=now or datetime.now(timezone.utc),
         )
 
         # Title with live indicator
@@ -187,7 +396,7 @@ class KickAlerts(commands.Cog):
         embed.set_author(
             name=f"🔴 {info['display_name']}{verified_badge} is LIVE on Kick!",
             url=info["channel_url"],
-            icon_url=info.get("avatar_url") or discord.Embed.Empty,
+            icon_url=info.get("avatar_url"),
         )
 
         embed.title = info.get("stream_title", "No Title")
@@ -240,34 +449,33 @@ class KickAlerts(commands.Cog):
 
         # Thumbnail
         if info.get("thumbnail_url"):
-            # Add cache-busting query param
+            # Bust Discord's image cache once per stream, not on every edit
             thumb = info["thumbnail_url"]
             if "?" not in thumb:
-                thumb += f"?t={int(datetime.now(timezone.utc).timestamp())}"
+                thumb += f"?t={info.get('stream_id') or 0}"
             embed.set_image(url=thumb)
         elif info.get("avatar_url"):
             embed.set_thumbnail(url=info["avatar_url"])
 
         # Footer
-        embed.set_footer(
-            text="Kick.com • Live Stream Alert",
-            icon_url="https://kick.com/favicon.ico",
-        )
+        embed.set_footer(text=LIVE_FOOTER_TEXT, icon_url=KICK_FAVICON)
 
         return embed
 
-    def _build_offline_embed(self, info: Dict[str, Any]) -> discord.Embed:
+    def _build_offline_embed(
+        self, info: Dict[str, Any], now: Optional[datetime] = None
+    ) -> discord.Embed:
         """Build an embed for when a streamer goes offline."""
         embed = discord.Embed(
             color=0x808080,
             description=f"**{info['display_name']}** has gone offline.\n"
                         f"[Visit Channel ↗]({info['channel_url']})",
-            timestamp=datetime.now(timezone.utc),
+            timestamp=now or datetime.now(timezone.utc),
         )
         embed.set_author(
             name=f"⚫ {info['display_name']} is now Offline",
             url=info["channel_url"],
-            icon_url=info.get("avatar_url") or discord.Embed.Empty,
+            icon_url=info.get("avatar_url"),
         )
         embed.set_footer(text="Kick.com • Stream Ended")
         return embed
@@ -283,51 +491,51 @@ class KickAlerts(commands.Cog):
             try:
                 all_guilds = await self.config.all_guilds()
 
+                active = []
                 for guild_id, guild_data in all_guilds.items():
                     guild = self.bot.get_guild(guild_id)
-                    if not guild:
-                        continue
-
-                    streamers = guild_data.get("streamers", {})
-                    if not streamers:
-                        continue
-
-                    check_interval = guild_data.get("check_interval", 60)
-                    embed_style = guild_data.get("embed_style", "detailed")
-                    show_viewers = guild_data.get("show_viewer_count", True)
-                    show_category = guild_data.get("show_category", True)
-                    auto_delete = guild_data.get("auto_delete", False)
-                    global_channel_id = guild_data.get("global_channel_id")
-                    global_ping_role_id = guild_data.get("global_ping_role_id")
-
-                    for username, streamer_config in streamers.items():
-                        try:
-                            await self._check_single_streamer(
-                                guild=guild,
-                                username=username,
-                                streamer_config=streamer_config,
-                                embed_style=embed_style,
-                                show_viewers=show_viewers,
-                                show_category=show_category,
-                                auto_delete=auto_delete,
-                                global_channel_id=global_channel_id,
-                                global_ping_role_id=global_ping_role_id,
-                            )
-                        except Exception as e:
-                            log.error(
-                                f"Error checking streamer {username} in guild {guild_id}: {e}",
-                                exc_info=True,
-                            )
-
-                        # Small delay between API calls to avoid rate limits
-                        await asyncio.sleep(2)
-
-                # Get the minimum check interval across all guilds (default 60s)
-                intervals = [
-                    g.get("check_interval", 60) for g in all_guilds.values() if g.get("streamers")
+                    if guild and guild_data.get("streamers"):
+                        active.append((guild, guild_data))
+
+                # Fetch each streamer once, however many guilds follow them,
+                # then fan the parsed result out to every guild below.
+                mono = time.monotonic()
+                usernames = [
+                    username
+                    for username in {
+                        username for _, guild_data in active for username in guild_data["streamers"]
+                    }
+                    # Long-idle streamers are skipped until their backoff expires
+                    if self._next_check.get(username, 0) <= mono
                 ]
-                sleep_time = min(intervals) if intervals else 60
-                sleep_time = max(sleep_time, 30)  # Never go below 30s
+                fetched = await asyncio.gather(
+                    *(self._fetch_channel_data(username) for username in usernames)
+                )
+                now = datetime.now(timezone.utc)
+                stream_infos = {
+                    username: self._parse_stream_info(data)
+                    for username, data in zip(usernames, fetched)
+                    if data is not None
+                }
+                for username, info in stream_infos.items():
+                    self._record_poll(username, info["is_live"])
+
+                # Guilds are processed concurrently so one large guild can't
+                # stall the others
+                results = await asyncio.gather(
+                    *(
+                        self._process_guild(guild, guild_data, stream_infos, now)
+                        for guild, guild_data in active
+                    ),
+                    return_exceptions=True,
+                )
+                for (guild, _), result in zip(active, results):
+                    if isinstance(result, Exception):
+                        log.error(
+                            f"Error processing guild {guild.id}: {result}", exc_info=result
+                        )
+
+                sleep_time = max(self._min_interval, 30)  # Never go below 30s
 
             except asyncio.CancelledError:
                 raise
@@ -337,10 +545,64 @@ class KickAlerts(commands.Cog):
 
             await asyncio.sleep(sleep_time)
 
+    async def _process_guild(
+        self,
+        guild: discord.Guild,
+        guild_data: Dict[str, Any],
+        stream_infos: Dict[str, Dict[str, Any]],
+        now: datetime,
+    ):
+        """Run the checks for one guild's streamers against this tick's stream info."""
+        # State still staged from a force check is newer than what Config returned
+        staged = self._state_cache.get(guild.id, {})
+        streamers = {
+            username: staged.get(username, streamer_config)
+            for username, streamer_config in guild_data["streamers"].items()
+            if username in stream_infos
+        }
+
+        embed_style = guild_data.get("embed_style", "detailed")
+        show_viewers = guild_data.get("show_viewer_count", True)
+        show_category = guild_data.get("show_category", True)
+        auto_delete = guild_data.get("auto_delete", False)
+        global_channel_id = guild_data.get("global_channel_id")
+        global_ping_role_id = guild_data.get("global_ping_role_id")
+
+        results = await asyncio.gather(
+            *(
+                self._check_single_streamer(
+                    guild=guild,
+                    username=username,
+                    info=stream_infos[username],
+                    streamer_config=streamer_config,
+                    embed_style=embed_style,
+                    show_viewers=show_viewers,
+                    show_category=show_category,
+                    auto_delete=auto_delete,
+                    global_channel_id=global_channel_id,
+                    global_ping_role_id=global_ping_role_id,
+                    now=now,
+                )
+                for username, streamer_config in streamers.items()
+            ),
+            return_exceptions=True,
+        )
+
+        for username, result in zip(streamers, results):
+            if isinstance(result, Exception):
+                log.error(
+                    f"Error checking streamer {username} in guild {guild.id}: {result}",
+                    exc_info=result,
+                )
+
+        # Save this guild now instead of waiting for the slowest guild in the tick
+        await self._flush_state(guild.id)
+
     async def _check_single_streamer(
         self,
         guild: discord.Guild,
         username: str,
+        info: Dict[str, Any],
         streamer_config: Dict[str, Any],
         embed_style: str,
         show_viewers: bool,
@@ -348,14 +610,13 @@ class KickAlerts(commands.Cog):
         auto_delete: bool,
         global_channel_id: Optional[int],
         global_ping_role_id: Optional[int],
+        now: Optional[datetime] = None,
     ):
-        """Check a single streamer and send/update announcement if needed."""
-        data = await self._fetch_channel_data(username)
-        if data is None:
-            return
-
-        info = self._parse_stream_info(data)
+        """Compare fetched stream info against stored state and send/update announcement.
 
+        State changes are applied to ``streamer_config`` in place and staged
+        for ``_flush_state`` as soon as they're made.
+        """
         was_live = streamer_config.get("is_live", False)
         is_live = info["is_live"]
         last_stream_id = streamer_config.get("last_stream_id")
@@ -375,7 +636,7 @@ class KickAlerts(commands.Cog):
 
         # ── Streamer went LIVE (new stream) ──
         if is_live and (not was_live or (current_stream_id and current_stream_id != last_stream_id)):
-            embed = self._build_live_embed(info, embed_style, show_viewers, show_category)
+            embed = self._build_live_embed(info, embed_style, show_viewers, show_category, now)
 
             # Build ping content
             content = None
@@ -386,65 +647,189 @@ class KickAlerts(commands.Cog):
 
             custom_msg = streamer_config.get("custom_message")
             if custom_msg:
-                # Support placeholders
-                custom_msg = custom_msg.replace("{streamer}", info["display_name"])
-                custom_msg = custom_msg.replace("{game}", info.get("category", "Unknown"))
-                custom_msg = custom_msg.replace("{title}", info.get("stream_title", "No Title"))
-                custom_msg = custom_msg.replace("{url}", info["channel_url"])
-                custom_msg = custom_msg.replace("{viewers}", str(info.get("viewer_count", 0)))
+                # Support placeholders in a single substitution pass; most
+                # messages have none, so skip building the mapping for those
+                if "{" in custom_msg:
+                    mapping = {
+                        "streamer": info["display_name"],
+                        "game": info.get("category") or "Unknown",
+                        "title": info.get("stream_title") or "No Title",
+                        "url": info["channel_url"],
+                        "viewers": info.get("viewer_count", 0),
+                    }
+                    custom_msg = PLACEHOLDER_RE.sub(
+                        lambda m: str(mapping[m.group(1)]), custom_msg
+                    )
                 content = f"{content}\n{custom_msg}" if content else custom_msg
 
             try:
                 msg = await channel.send(content=content, embed=embed)
-
-                # Save state
-                async with self.config.guild(guild).streamers() as streamers:
-                    if username in streamers:
-                        streamers[username]["is_live"] = True
-                        streamers[username]["last_stream_id"] = current_stream_id
-                        streamers[username]["last_message_id"] = msg.id
-
             except discord.Forbidden:
                 log.warning(f"Missing permissions to send in {channel} (guild: {guild.id})")
+            except discord.NotFound:
+                log.warning(f"Announcement channel {channel_id} no longer exists (guild: {guild.id})")
             except discord.HTTPException as e:
                 log.warning(f"Failed to send announcement for {username}: {e}")
+            else:
+                streamer_config["is_live"] = True
+                streamer_config["last_stream_id"] = current_stream_id
+                streamer_config["last_message_id"] = msg.id
+                streamer_config["last_viewer_count"] = info.get("viewer_count", 0)
+                streamer_config["last_title"] = info.get("stream_title")
+                streamer_config["last_category"] = info.get("category")
+                self._mark_dirty(guild.id, username, streamer_config)
+                self._live_messages[(guild.id, username)] = msg
 
         # ── Streamer went OFFLINE ──
         elif not is_live and was_live:
-            async with self.config.guild(guild).streamers() as streamers:
-                if username in streamers:
-                    streamers[username]["is_live"] = False
-
-                    last_msg_id = streamers[username].get("last_message_id")
-
-                    # Auto-delete or update the old message
-                    if last_msg_id and channel:
-                        try:
-                            old_msg = await channel.fetch_message(last_msg_id)
+            last_msg_id = streamer_config.get("last_message_id")
+            streamer_config["is_live"] = False
+            streamer_config["last_message_id"] = None
+            self._mark_dirty(guild.id, username, streamer_config)
 
-                            delete_after = streamer_config.get("delete_after_offline", auto_delete)
-                            if delete_after:
-                                await old_msg.delete()
-                            else:
-                                # Update embed to show offline
-                                offline_embed = self._build_offline_embed(info)
-                                await old_msg.edit(content=None, embed=offline_embed)
-                        except (discord.NotFound, discord.Forbidden, discord.HTTPException):
-                            pass
+            # Auto-delete or update the old message
+            if last_msg_id and channel:
+                try:
+                    old_msg = await self._get_announcement(guild, username, channel, last_msg_id)
+
+                    delete_after = streamer_config.get("delete_after_offline", auto_delete)
+                    if delete_after:
+                        await old_msg.delete()
+                    else:
+                        # Update embed to show offline
+                        offline_embed = self._build_offline_embed(info, now)
+                        await old_msg.edit(content=None, embed=offline_embed)
+                except (discord.NotFound, discord.Forbidden, discord.HTTPException):
+                    pass
 
-                    streamers[username]["last_message_id"] = None
+            self._live_messages.pop((guild.id, username), None)
 
         # ── Still live — optionally update viewer count ──
         elif is_live and was_live and embed_style == "detailed":
-            # Update the existing message with new viewer count (every cycle)
+            # Only edit when the embed would visibly change: a large enough
+            # viewer swing, a new title, or a new category (viewers and
+            # category only count when the embed shows them)
+            viewers = info.get("viewer_count", 0)
+            last_viewers = streamer_config.get("last_viewer_count") or 0
+            viewers_changed = (
+                show_viewers
+                and abs(viewers - last_viewers) / max(last_viewers, 1) > VIEWER_DELTA_THRESHOLD
+            )
+            category_changed = (
+                show_category
+                and info.get("category") != streamer_config.get("last_category")
+            )
+            if (
+                not viewers_changed
+                and not category_changed
+                and info.get("stream_title") == streamer_config.get("last_title")
+            ):
+                return
+
             last_msg_id = streamer_config.get("last_message_id")
             if last_msg_id and channel:
                 try:
-                    old_msg = await channel.fetch_message(last_msg_id)
-                    embed = self._build_live_embed(info, embed_style, show_viewers, show_category)
+                    old_msg = await self._get_announcement(guild, username, channel, last_msg_id)
+                    embed = self._build_live_embed(
+                        info, embed_style, show_viewers, show_category, now
+                    )
                     await old_msg.edit(embed=embed)
                 except (discord.NotFound, discord.Forbidden, discord.HTTPException):
-                    pass
+                    self._live_messages.pop((guild.id, username), None)
+                else:
+                    streamer_config["last_viewer_count"] = viewers
+                    streamer_config["last_title"] = info.get("stream_title")
+                    streamer_config["last_category"] = info.get("category")
+                    self._mark_dirty(guild.id, username, streamer_config)
+
+    async def _refresh_min_interval(self):
+        """Recompute the checker's sleep time after intervals or streamer lists change."""
+        all_guilds = await self.config.all_guilds()
+        intervals = [
+            g.get("check_interval", 60) for g in all_guilds.values() if g.get("streamers")
+        ]
+        self._min_interval = min(intervals) if intervals else 60
+
+    async def _get_announcement(
+        self,
+        guild: discord.Guild,
+        username: str,
+        channel: discord.abc.Messageable,
+        message_id: int,
+    ) -> discord.Message:
+        """Return the live announcement for a streamer, fetching it only if not cached."""
+        key = (guild.id, username)
+        message = self._live_messages.get(key)
+        if message is None or message.id != message_id:
+            message = await channel.fetch_message(message_id)
+            self._live_messages[key] = message
+        return message
+
+    def _record_poll(self, username: str, is_live: bool):
+        """Track consecutive offline polls and push back checks for idle streamers."""
+        if is_live:
+            self._offline_streaks.pop(username, None)
+            self._next_check.pop(username, None)
+            return
+
+        streak = self._offline_streaks.get(username, 0) + 1
+        self._offline_streaks[username] = streak
+        if streak >= OFFLINE_BACKOFF_AFTER:
+            exponent = min(streak - OFFLINE_BACKOFF_AFTER, 4)
+            delay = min(OFFLINE_BACKOFF_BASE * 2 ** exponent, OFFLINE_BACKOFF_MAX)
+            self._next_check[username] = time.monotonic() + delay
+
+    async def _prune_poll_state(self):
+        """Drop backoff tracking for usernames no guild monitors any more."""
+        all_guilds = await self.config.all_guilds()
+        monitored = {
+            username for g in all_guilds.values() for username in g.get("streamers", {})
+        }
+        for tracked in (self._offline_streaks, self._next_check):
+            for username in [username for username in tracked if username not in monitored]:
+                del tracked[username]
+
+    def _mark_dirty(self, guild_id: int, username: str, streamer_config: Dict[str, Any]):
+        """Stage a streamer's updated state for the next _flush_state()."""
+        self._state_cache.setdefault(guild_id, {})[username] = streamer_config
+        self._dirty.add((guild_id, username))
+
+    async def _flush_state(self, guild_id: Optional[int] = None):
+        """Persist staged streamer state, with one Config write per guild.
+
+        Only ``guild_id`` is written when given; otherwise every guild is.
+        """
+        by_guild: Dict[int, List[str]] = {}
+        for dirty_gid, username in self._dirty:
+            if guild_id is None or dirty_gid == guild_id:
+                by_guild.setdefault(dirty_gid, []).append(username)
+
+        for dirty_gid, usernames in by_guild.items():
+            # Unstage only this guild; the rest stay pending until their own write
+            self._dirty.difference_update((dirty_gid, username) for username in usernames)
+            streamers = {
+                username: self._state_cache[dirty_gid][username] for username in usernames
+            }
+            try:
+                async with self.config.guild_from_id(dirty_gid).streamers() as stored:
+                    for username, streamer_config in streamers.items():
+                        # Skip streamers removed while the check was running
+                        if username in stored:
+                            for key in STREAMER_STATE_KEYS:
+                                if key in streamer_config:
+                                    stored[username][key] = streamer_config[key]
+            except Exception as e:
+                # Keep the state staged so the next flush retries it
+                self._dirty.update((dirty_gid, username) for username in usernames)
+                log.error(f"Failed to save streamer state for guild {dirty_gid}: {e}", exc_info=True)
+                continue
+
+            guild_cache = self._state_cache.get(dirty_gid, {})
+            for username in usernames:
+                if (dirty_gid, username) not in self._dirty:
+                    guild_cache.pop(username, None)
+            if not guild_cache:
+                self._state_cache.pop(dirty_gid, None)
 
     # ─── Commands ───────────────────────────────────────────────────────
 
@@ -472,11 +857,13 @@ class KickAlerts(commands.Cog):
         **Example:**
         `[p]kickalert add xqc #stream-alerts`
         """
-        username = username.lower().strip().strip("/")
+        username = username.strip().strip("/").lower()
 
         # Validate the streamer exists
-        async with ctx.typing():
-            data = await self._fetch_channel_data(username)
+        data = self._channel_cache_get(username)
+        if data is None:
+            async with ctx.typing():
+                data = await self._fetch_channel_data(username)
 
         if data is None:
             return await ctx.send(
@@ -510,8 +897,13 @@ class KickAlerts(commands.Cog):
                 "last_message_id": None,
                 "is_live": info["is_live"],
                 "last_stream_id": info.get("stream_id"),
+                "last_viewer_count": info.get("viewer_count", 0),
+                "last_title": info.get("stream_title"),
+                "last_category": info.get("category"),
             }
 
+        await self._refresh_min_interval()
+
         embed = discord.Embed(
             color=KICK_COLOR,
             title="✅ Streamer Added",
@@ -519,7 +911,7 @@ class KickAlerts(commands.Cog):
                 f"Now monitoring **[{info['display_name']}]({info['channel_url']})** on Kick.com\n\n"
                 f"📺 **Channel:** {channel.mention if channel else 'Global channel'}\n"
                 f"📊 **Status:** {'🔴 Currently LIVE' if info['is_live'] else '⚫ Offline'}\n"
-                f"👥 **Followers:** {info.get('followers', 0):,}"
+                f"👥 **Followers:** {info.get('followers_fmt', '0')}"
             ),
         )
         if info.get("avatar_url"):
@@ -534,13 +926,16 @@ class KickAlerts(commands.Cog):
         **Example:**
         `[p]kickalert remove xqc`
         """
-        username = username.lower().strip()
+        username = username.strip().lower()
 
         async with self.config.guild(ctx.guild).streamers() as streamers:
             if username not in streamers:
                 return await ctx.send(f"❌ **{username}** is not being monitored.")
             del streamers[username]
 
+        self._live_messages.pop((ctx.guild.id, username), None)
+        await self._refresh_min_interval()
+        await self._prune_poll_state()
         await ctx.send(f"✅ Removed **{username}** from Kick alerts.")
 
     @kickalert.command(name="list")
@@ -615,7 +1010,7 @@ class KickAlerts(commands.Cog):
         `[p]kickalert setrole @LiveAlerts xqc` — only for xqc
         """
         if username:
-            username = username.lower().strip()
+            username = username.strip().lower()
             async with self.config.guild(ctx.guild).streamers() as streamers:
                 if username not in streamers:
                     return await ctx.send(f"❌ **{username}** is not being monitored.")
@@ -636,7 +1031,7 @@ class KickAlerts(commands.Cog):
         `[p]kickalert removerole xqc` — remove ping for xqc
         """
         if username:
-            username = username.lower().strip()
+            username = username.strip().lower()
             async with self.config.guild(ctx.guild).streamers() as streamers:
                 if username not in streamers:
                     return await ctx.send(f"❌ **{username}** is not being monitored.")
@@ -665,7 +1060,7 @@ class KickAlerts(commands.Cog):
         Use without a message to clear:
         `[p]kickalert message xqc`
         """
-        username = username.lower().strip()
+        username = username.strip().lower()
 
         async with self.config.guild(ctx.guild).streamers() as streamers:
             if username not in streamers:
@@ -692,6 +1087,7 @@ class KickAlerts(commands.Cog):
             return await ctx.send("❌ Maximum interval is **600 seconds** (10 minutes).")
 
         await self.config.guild(ctx.guild).check_interval.set(seconds)
+        await self._refresh_min_interval()
         await ctx.send(f"✅ Check interval set to **{seconds} seconds**.")
 
     @kickalert.command(name="style")
@@ -734,10 +1130,10 @@ class KickAlerts(commands.Cog):
         **Example:**
         `[p]kickalert test xqc`
         """
-        username = username.lower().strip()
+        username = username.strip().lower()
 
         async with ctx.typing():
-            data = await self._fetch_channel_data(username)
+            data = await self._fetch_channel_data(username, force=True)
 
         if data is None:
             return await ctx.send(f"❌ Could not find Kick.com channel **{username}**.")
@@ -746,16 +1142,13 @@ class KickAlerts(commands.Cog):
 
         # If offline, fill in mock data for preview
         if not info["is_live"]:
-            info["is_live"] = True
-            info["stream_title"] = info.get("stream_title") or "🔴 Test Stream — This is a Preview!"
-            info["viewer_count"] = info.get("viewer_count") or 1234
-            info["category"] = info.get("category") or "Just Chatting"
+            info.update({key: value for key, value in TEST_DEFAULTS.items() if not info.get(key)})
             info["started_at"] = datetime.now(timezone.utc).isoformat()
-            info["tags"] = info.get("tags") or ["English", "Test"]
 
-        style = await self.config.guild(ctx.guild).embed_style()
-        show_viewers = await self.config.guild(ctx.guild).show_viewer_count()
-        show_category = await self.config.guild(ctx.guild).show_category()
+        guild_data = await self.config.guild(ctx.guild).all()
+        style = guild_data.get("embed_style", "detailed")
+        show_viewers = guild_data.get("show_viewer_count", True)
+        show_category = guild_data.get("show_category", True)
 
         embed = self._build_live_embed(info, style, show_viewers, show_category)
 
@@ -768,10 +1161,12 @@ class KickAlerts(commands.Cog):
         **Example:**
         `[p]kickalert check xqc`
         """
-        username = username.lower().strip()
+        username = username.strip().lower()
 
-        async with ctx.typing():
-            data = await self._fetch_channel_data(username)
+        data = self._channel_cache_get(username)
+        if data is None:
+            async with ctx.typing():
+                data = await self._fetch_channel_data(username)
 
         if data is None:
             return await ctx.send(f"❌ Could not find Kick.com channel **{username}**.")
@@ -787,7 +1182,7 @@ class KickAlerts(commands.Cog):
                 url=info["channel_url"],
                 description=(
                     f"**{info['display_name']}** is currently not streaming.\n\n"
-                    f"👥 **Followers:** {info.get('followers', 0):,}\n"
+                    f"👥 **Followers:** {info.get('followers_fmt', '0')}\n"
                     f"🔗 [Visit Channel]({info['channel_url']})"
                 ),
             )
@@ -802,61 +1197,14 @@ class KickAlerts(commands.Cog):
         """View current KickAlerts configuration for this server."""
         guild_data = await self.config.guild(ctx.guild).all()
 
-        global_ch = guild_data.get("global_channel_id")
-        global_role = guild_data.get("global_ping_role_id")
-        interval = guild_data.get("check_interval", 60)
-        style = guild_data.get("embed_style", "detailed")
-        auto_del = guild_data.get("auto_delete", False)
-        show_viewers = guild_data.get("show_viewer_count", True)
-        show_cat = guild_data.get("show_category", True)
-        streamer_count = len(guild_data.get("streamers", {}))
-
         embed = discord.Embed(
             color=KICK_COLOR,
             title="⚙️ KickAlerts Settings",
             timestamp=datetime.now(timezone.utc),
         )
 
-        embed.add_field(
-            name="📺 Global Channel",
-            value=f"<#{global_ch}>" if global_ch else "Not set",
-            inline=True,
-        )
-        embed.add_field(
-            name="🔔 Global Ping Role",
-            value=f"<@&{global_role}>" if global_role else "None",
-            inline=True,
-        )
-        embed.add_field(
-            name="📊 Monitored Streamers",
-            value=str(streamer_count),
-            inline=True,
-        )
-        embed.add_field(
-            name="⏱️ Check Interval",
-            value=f"{interval}s",
-            inline=True,
-        )
-        embed.add_field(
-            name="🎨 Embed Style",
-            value=style.capitalize(),
-            inline=True,
-        )
-        embed.add_field(
-            name="🗑️ Auto-Delete on Offline",
-            value="Yes" if auto_del else "No",
-            inline=True,
-        )
-        embed.add_field(
-            name="👁️ Show Viewers",
-            value="Yes" if show_viewers else "No",
-            inline=True,
-        )
-        embed.add_field(
-            name="🎮 Show Category",
-            value="Yes" if show_cat else "No",
-            inline=True,
-        )
+        for name, value_fn, inline in self._SETTINGS_FIELDS:
+            embed.add_field(name=name, value=value_fn(guild_data), inline=inline)
 
         await ctx.send(embed=embed)
 
@@ -898,6 +1246,10 @@ class KickAlerts(commands.Cog):
             )
 
         await self.config.guild(ctx.guild).clear()
+        for key in [key for key in self._live_messages if key[0] == ctx.guild.id]:
+            del self._live_messages[key]
+        await self._refresh_min_interval()
+        await self._prune_poll_state()
         await ctx.send("✅ All KickAlerts data has been cleared for this server.")
 
     @kickalert.command(name="force", aliases=["forcecheck"])
@@ -907,21 +1259,23 @@ class KickAlerts(commands.Cog):
         **Example:**
         `[p]kickalert force`
         """
-        streamers = await self.config.guild(ctx.guild).streamers()
+        guild_data = await self.config.guild(ctx.guild).all()
+        streamers = guild_data["streamers"]
         if not streamers:
             return await ctx.send("📭 No streamers to check.")
 
-        guild_data = await self.config.guild(ctx.guild).all()
-
-        checked = 0
-        live = 0
-
-        async with ctx.typing():
-            for username, streamer_config in streamers.items():
-                try:
+        async def _one(username: str, streamer_config: Dict[str, Any]) -> Optional[bool]:
+            """Check one streamer; returns its live status, or None if the check failed."""
+            try:
+                data = await self._fetch_channel_data(username, force=True)
+                if data is not None:
+                    info = self._parse_stream_info(data)
+                    if info["is_live"]:
+                        self._record_poll(username, True)
                     await self._check_single_streamer(
                         guild=ctx.guild,
                         username=username,
+                        info=info,
                         streamer_config=streamer_config,
                         embed_style=guild_data.get("embed_style", "detailed"),
                         show_viewers=guild_data.get("show_viewer_count", True),
@@ -930,16 +1284,26 @@ class KickAlerts(commands.Cog):
                         global_channel_id=guild_data.get("global_channel_id"),
                         global_ping_role_id=guild_data.get("global_ping_role_id"),
                     )
-                    checked += 1
+                # streamer_config is updated in place by the check
+                return bool(streamer_config.get("is_live"))
+            except Exception as e:
+                log.error(f"Error force-checking {username}: {e}")
+                return None
 
-                    # Re-read to get updated state
-                    updated = await self.config.guild(ctx.guild).streamers()
-                    if updated.get(username, {}).get("is_live"):
-                        live += 1
+        # Prefer state the checker has staged but not yet saved, so a live
+        # announcement it just sent isn't sent again
+        staged = self._state_cache.get(ctx.guild.id, {})
+        async with ctx.typing():
+            live_flags = await asyncio.gather(
+                *(
+                    _one(username, staged.get(username, streamer_config))
+                    for username, streamer_config in streamers.items()
+                )
+            )
+            await self._flush_state(ctx.guild.id)
 
-                    await asyncio.sleep(1)
-                except Exception as e:
-                    log.error(f"Error force-checking {username}: {e}")
+        checked = sum(1 for flag in live_flags if flag is not None)
+        live = sum(1 for flag in live_flags if flag)
 
         await ctx.send(
             f"✅ Force-checked **{checked}** streamer(s). "